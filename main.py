@@ -7,9 +7,9 @@ import logging
 import os
 import signal
 import sys
+from typing import Any, Dict, Optional
 
 from youtrack_mcp.config import Config, config
-from youtrack_mcp.fastmcp_server import get_server, close
 
 # Set up logging
 logging.basicConfig(
@@ -19,34 +19,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefix of environment variables that override configuration keys
+_ENV_PREFIX = "YOUTRACK_MCP_"
+_ENV_PREFIX_LEN = len(_ENV_PREFIX)
 
-def load_config():
-    """Load configuration from environment variables or file."""
+# Configuration keys that can be overridden from the environment
+_CONFIG_KEYS = frozenset(k for k in vars(Config) if k.isupper() and not k.startswith("_"))
+_BOOL_KEYS = frozenset(k for k in _CONFIG_KEYS if isinstance(getattr(Config, k, None), bool))
+_INT_KEYS = frozenset(k for k in _CONFIG_KEYS if type(getattr(Config, k, None)) is int)
+_FLOAT_KEYS = frozenset(k for k in _CONFIG_KEYS if isinstance(getattr(Config, k, None), float))
+
+
+def load_config(overrides: Optional[Dict[str, Any]] = None):
+    """
+    Load configuration from environment variables and apply overrides.
+    
+    Args:
+        overrides: Configuration values (e.g. from the command line) that take
+            precedence over environment variables
+            
+    Raises:
+        ValueError: If a numeric setting is overridden with a non-numeric value
+    """
     env_config = {}
     
     # Extract config variables from environment
-    for key in dir(Config):
-        if key.isupper() and not key.startswith("_"):
-            env_key = f"YOUTRACK_MCP_{key}"
-            if env_key in os.environ:
-                env_value = os.environ[env_key]
-                # Convert string booleans to actual booleans
-                if env_value.lower() in ("true", "false"):
-                    env_value = env_value.lower() == "true"
-                env_config[key] = env_value
-    
-    # Create config instance from environment variables
+    env_items = {
+        k[_ENV_PREFIX_LEN:]: v
+        for k, v in os.environ.items()
+        if k.startswith(_ENV_PREFIX)
+    }
+    for key, env_value in env_items.items():
+        if key in _CONFIG_KEYS:
+            # Convert the string to the type of the setting's default
+            try:
+                if key in _BOOL_KEYS:
+                    env_value = env_value.lower() in ("true", "1", "yes")
+                elif key in _INT_KEYS:
+                    env_value = int(env_value)
+                elif key in _FLOAT_KEYS:
+                    env_value = float(env_value)
+            except ValueError:
+                expected = "an integer" if key in _INT_KEYS else "a number"
+                raise ValueError(f"{_ENV_PREFIX}{key} must be {expected}, got {env_value!r}") from None
+            env_config[key] = env_value
+    
     if env_config:
         logger.info("Loading configuration from environment variables")
-        Config.from_dict(env_config)
+    
+    # Apply environment and command line values in a single pass
+    merged = {**env_config, **(overrides or {})}
+    if merged:
+        Config.from_dict(merged)
     
     # Log configuration status
     if config.YOUTRACK_URL:
-        logger.info(f"Configured for self-hosted YouTrack instance at: {config.YOUTRACK_URL}")
+        logger.info("Configured for self-hosted YouTrack instance at: %s", config.YOUTRACK_URL)
     else:
         logger.info("Configured for YouTrack Cloud instance")
     
-    logger.info(f"SSL verification: {'Enabled' if config.VERIFY_SSL else 'Disabled'}")
+    logger.info("SSL verification: %s", "Enabled" if config.VERIFY_SSL else "Disabled")
 
 
 def parse_args():
@@ -84,8 +116,16 @@ def parse_args():
     return parser.parse_args()
 
 
-def apply_cli_args(args):
-    """Apply command line arguments to configuration."""
+def apply_cli_args(args) -> Dict[str, Any]:
+    """
+    Apply command line arguments and collect configuration overrides.
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        Dictionary of configuration values given on the command line
+    """
     # Set log level
     logging.getLogger().setLevel(getattr(logging, args.log_level))
     
@@ -101,8 +141,7 @@ def apply_cli_args(args):
     if args.verify_ssl is not None:
         config_dict["VERIFY_SSL"] = args.verify_ssl
     
-    if config_dict:
-        Config.from_dict(config_dict)
+    return config_dict
 
 
 def handle_signal(signum: int, frame) -> None:
@@ -113,7 +152,9 @@ def handle_signal(signum: int, frame) -> None:
         signum: Signal number
         frame: Current stack frame
     """
-    logging.info(f"Received signal {signum}, shutting down...")
+    logging.info("Received signal %s, shutting down...", signum)
+    # Already imported by main() before the handlers were registered
+    from youtrack_mcp.fastmcp_server import close
     close()
     sys.exit(0)
 
@@ -123,10 +164,18 @@ def main():
     args = parse_args()
     
     # Apply command line arguments
-    apply_cli_args(args)
+    cli_overrides = apply_cli_args(args)
     
     # Load configuration
-    load_config()
+    try:
+        load_config(cli_overrides)
+    except ValueError as e:
+        logger.error("Invalid configuration: %s", e)
+        sys.exit(1)
+    
+    # Import the server only once configuration is final; this also keeps
+    # --help and argument errors from loading FastMCP and the API clients
+    from youtrack_mcp.fastmcp_server import get_server, close
     
     # Register signal handlers
     signal.signal(signal.SIGINT, handle_signal)
@@ -136,13 +185,13 @@ def main():
         # Get FastMCP server
         server = get_server()
         
-        logger.info(f"Starting YouTrack MCP server ({config.MCP_SERVER_NAME}) on {args.host}:{args.port}")
+        logger.info("Starting YouTrack MCP server (%s) on %s:%s", config.MCP_SERVER_NAME, args.host, args.port)
         
         # Run the server (FastMCP handles HTTP automatically)
         server.run()
         
     except Exception as e:
-        logging.exception(f"Error starting server: {e}")
+        logging.exception("Error starting server: %s", e)
         sys.exit(1)
     finally:
         close()
@@ -11,7 +11,7 @@ import sys
 # Add the youtrack_mcp module to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
-from youtrack_mcp.allowed_tickets import load_allowed_parent_tickets
+from youtrack_mcp.allowed_tickets import clear_cache, load_allowed_parent_tickets
 
 
 class TestAllowedTickets(unittest.TestCase):
@@ -19,20 +19,18 @@ class TestAllowedTickets(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.test_file = 'parent-ticket.json'
+        self.tmp = tempfile.TemporaryDirectory()
+        self.test_file = os.path.join(self.tmp.name, 'parent-ticket.json')
+        clear_cache()
         
     def tearDown(self):
         """Clean up after each test method."""
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        self.tmp.cleanup()
+        clear_cache()
     
     def test_load_allowed_parent_tickets_file_not_exists(self):
         """Test loading when parent-ticket.json doesn't exist."""
-        # Ensure file doesn't exist
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-        
-        result = load_allowed_parent_tickets()
+        result = load_allowed_parent_tickets(self.test_file)
         self.assertIsNone(result)
     
     def test_load_allowed_parent_tickets_valid_file(self):
@@ -44,8 +42,8 @@ class TestAllowedTickets(unittest.TestCase):
         with open(self.test_file, 'w') as f:
             json.dump(test_data, f)
         
-        result = load_allowed_parent_tickets()
-        self.assertEqual(result, ["DEVOPS-123", "DEVOPS-456", "PROJECT-789"])
+        result = load_allowed_parent_tickets(self.test_file)
+        self.assertEqual(result, ("DEVOPS-123", "DEVOPS-456", "PROJECT-789"))
     
     def test_load_allowed_parent_tickets_empty_tickets(self):
         """Test loading with an empty tickets array."""
@@ -56,7 +54,7 @@ class TestAllowedTickets(unittest.TestCase):
         with open(self.test_file, 'w') as f:
             json.dump(test_data, f)
         
-        result = load_allowed_parent_tickets()
+        result = load_allowed_parent_tickets(self.test_file)
         self.assertIsNone(result)
     
     def test_load_allowed_parent_tickets_missing_tickets_key(self):
@@ -68,7 +66,7 @@ class TestAllowedTickets(unittest.TestCase):
         with open(self.test_file, 'w') as f:
             json.dump(test_data, f)
         
-        result = load_allowed_parent_tickets()
+        result = load_allowed_parent_tickets(self.test_file)
         self.assertIsNone(result)
     
     def test_load_allowed_parent_tickets_invalid_json(self):
@@ -76,18 +74,30 @@ class TestAllowedTickets(unittest.TestCase):
         with open(self.test_file, 'w') as f:
             f.write("invalid json content")
         
-        result = load_allowed_parent_tickets()
-        self.assertEqual(result, [])
+        result = load_allowed_parent_tickets(self.test_file)
+        self.assertEqual(result, ())
+    
+    def test_load_allowed_parent_tickets_empty_file(self):
+        """Test loading an empty file without invoking the JSON parser."""
+        open(self.test_file, 'w').close()
+        
+        # Without ijson the file would go through orjson.loads
+        with patch('youtrack_mcp.allowed_tickets.ijson', None), \
+                patch('youtrack_mcp.allowed_tickets.orjson.loads') as mock_loads:
+            result = load_allowed_parent_tickets(self.test_file)
+            mock_loads.assert_not_called()
+        self.assertEqual(result, ())
     
     def test_load_allowed_parent_tickets_file_read_error(self):
         """Test handling of file read errors."""
+        with open(self.test_file, 'w') as f:
+            json.dump({"tickets": ["DEVOPS-123"]}, f)
+        
         with patch('builtins.open', mock_open()) as mock_file:
             mock_file.side_effect = IOError("Permission denied")
             
-            # Mock os.path.exists to return True
-            with patch('os.path.exists', return_value=True):
-                result = load_allowed_parent_tickets()
-                self.assertEqual(result, [])
+            result = load_allowed_parent_tickets(self.test_file)
+            self.assertEqual(result, ())
     
     def test_load_allowed_parent_tickets_with_single_ticket(self):
         """Test loading with a single ticket."""
@@ -98,8 +108,8 @@ class TestAllowedTickets(unittest.TestCase):
         with open(self.test_file, 'w') as f:
             json.dump(test_data, f)
         
-        result = load_allowed_parent_tickets()
-        self.assertEqual(result, ["DEVOPS-100"])
+        result = load_allowed_parent_tickets(self.test_file)
+        self.assertEqual(result, ("DEVOPS-100",))
     
     def test_load_allowed_parent_tickets_with_duplicate_tickets(self):
         """Test loading with duplicate ticket IDs."""
@@ -110,9 +120,24 @@ class TestAllowedTickets(unittest.TestCase):
         with open(self.test_file, 'w') as f:
             json.dump(test_data, f)
         
-        result = load_allowed_parent_tickets()
-        # The function should return the list as-is, including duplicates
-        self.assertEqual(result, ["DEVOPS-123", "DEVOPS-123", "DEVOPS-456"])
+        result = load_allowed_parent_tickets(self.test_file)
+        # The function should return the tickets as-is, including duplicates
+        self.assertEqual(result, ("DEVOPS-123", "DEVOPS-123", "DEVOPS-456"))
+    
+    def test_load_allowed_parent_tickets_cached_until_file_changes(self):
+        """Test that the parsed file is reused until it is modified."""
+        with open(self.test_file, 'w') as f:
+            json.dump({"tickets": ["DEVOPS-123"]}, f)
+        
+        first = load_allowed_parent_tickets(self.test_file)
+        with patch('builtins.open', side_effect=AssertionError("file re-read")):
+            self.assertIs(load_allowed_parent_tickets(self.test_file), first)
+        
+        with open(self.test_file, 'w') as f:
+            json.dump({"tickets": ["DEVOPS-123", "DEVOPS-456"]}, f)
+        
+        result = load_allowed_parent_tickets(self.test_file)
+        self.assertEqual(result, ("DEVOPS-123", "DEVOPS-456"))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,122 @@
+"""
+Tests for the rate limiting in youtrack_mcp/api/client.py.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+# Add the youtrack_mcp module to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from youtrack_mcp.api.client import YouTrackClient
+
+
+def make_response(status_code=200, body=None, headers=None):
+    """Build a requests.Response without going over the network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps({} if body is None else body).encode()
+    return response
+
+
+class TestRateLimit(unittest.TestCase):
+    """Test cases for the client's rate limit handling."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = YouTrackClient(base_url="http://youtrack.test", api_token="token")
+        self.client.max_rate_limit_wait = 60.0
+    
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.client.close()
+    
+    def pause(self):
+        """Seconds until the client sends its next request."""
+        return self.client._pause_until - time.monotonic()
+    
+    def test_no_rate_limit_headers(self):
+        """Test that ordinary responses do not pause the client."""
+        self.client._note_rate_limit(make_response(headers={"X-RateLimit-Remaining": "5"}))
+        self.assertLessEqual(self.pause(), 0)
+    
+    def test_retry_after_seconds(self):
+        """Test that Retry-After in seconds pauses the client for that long."""
+        self.client._note_rate_limit(make_response(429, headers={"Retry-After": "2"}))
+        self.assertAlmostEqual(self.pause(), 2, delta=0.1)
+    
+    def test_retry_after_http_date_ignored(self):
+        """Test that an HTTP-date Retry-After is ignored."""
+        self.client._note_rate_limit(make_response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+        self.assertLessEqual(self.pause(), 0)
+    
+    def test_reset_in_epoch_seconds(self):
+        """Test that an exhausted limit waits until an epoch reset time."""
+        reset = str(time.time() + 5)
+        self.client._note_rate_limit(make_response(headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}))
+        self.assertAlmostEqual(self.pause(), 5, delta=0.1)
+    
+    def test_reset_in_epoch_milliseconds(self):
+        """Test that a reset time in epoch milliseconds is converted."""
+        reset = str((time.time() + 5) * 1000)
+        self.client._note_rate_limit(make_response(headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}))
+        self.assertAlmostEqual(self.pause(), 5, delta=0.1)
+    
+    def test_pause_is_capped(self):
+        """Test that a very long requested pause is capped."""
+        self.client._note_rate_limit(make_response(429, headers={"Retry-After": "86400"}))
+        self.assertAlmostEqual(self.pause(), 60, delta=0.1)
+    
+    def test_send_waits_before_taking_a_slot(self):
+        """Test that a paused request does not hold a concurrency slot while waiting."""
+        self.client._request_slots = threading.BoundedSemaphore(1)
+        self.client._pause_until = time.monotonic() + 1
+        self.client.session.request = lambda *args, **kwargs: make_response()
+        
+        free_slots = []
+        
+        def sleep(seconds):
+            acquired = self.client._request_slots.acquire(blocking=False)
+            if acquired:
+                self.client._request_slots.release()
+            free_slots.append(acquired)
+        
+        with patch('youtrack_mcp.api.client.time.sleep', side_effect=sleep):
+            self.client._send("GET", "http://youtrack.test/api/issues")
+        self.assertEqual(free_slots, [True])
+    
+    def test_send_limits_requests_in_flight(self):
+        """Test that no more than the configured number of requests run at once."""
+        self.client._request_slots = threading.BoundedSemaphore(2)
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+        
+        def request(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return make_response()
+        
+        self.client.session.request = request
+        threads = [threading.Thread(target=self.client._send, args=("GET", "http://youtrack.test/api/issues"))
+                   for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(peak[0], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Tests for youtrack_mcp/fastmcp_server.py.
+"""
+import asyncio
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the youtrack_mcp module to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from youtrack_mcp.config import Config
+
+# The server module builds its client on import, which needs a URL and a token
+if not Config.YOUTRACK_URL and not Config.YOUTRACK_CLOUD:
+    Config.YOUTRACK_URL = "http://youtrack.test"
+if not Config.YOUTRACK_API_TOKEN:
+    Config.YOUTRACK_API_TOKEN = "token"
+
+from youtrack_mcp import fastmcp_server
+from youtrack_mcp.fastmcp_server import _compact_issue
+
+
+class TestCompactIssue(unittest.TestCase):
+    """Test cases for _compact_issue."""
+    
+    def test_custom_field_values(self):
+        """Test that each kind of custom field value reduces to a plain value."""
+        issue = {
+            "$type": "Issue",
+            "id": "2-1",
+            "customFields": [
+                {"$type": "SingleEnumIssueCustomField", "name": "Priority",
+                 "value": {"$type": "EnumBundleElement", "name": "Major"}},
+                {"$type": "StateIssueCustomField", "name": "State",
+                 "value": {"$type": "StateBundleElement", "name": "Open"}},
+                {"$type": "MultiVersionIssueCustomField", "name": "Fix versions",
+                 "value": [{"$type": "VersionBundleElement", "name": "1.0"},
+                           {"$type": "VersionBundleElement", "name": "1.1"}]},
+                {"$type": "PeriodIssueCustomField", "name": "Estimation",
+                 "value": {"$type": "PeriodValue", "presentation": "1d 2h"}},
+                {"$type": "SingleUserIssueCustomField", "name": "Assignee",
+                 "value": {"$type": "User", "login": "jdoe"}},
+                {"$type": "TextIssueCustomField", "name": "Notes",
+                 "value": {"$type": "TextFieldValue", "text": "Some notes"}},
+                {"$type": "SimpleIssueCustomField", "name": "Story points", "value": 3},
+                {"$type": "SingleEnumIssueCustomField", "name": "Type", "value": None},
+            ]
+        }
+        
+        result = _compact_issue(issue)
+        
+        self.assertEqual(result, {
+            "id": "2-1",
+            "customFields": {
+                "Priority": "Major",
+                "State": "Open",
+                "Fix versions": ["1.0", "1.1"],
+                "Estimation": "1d 2h",
+                "Assignee": "jdoe",
+                "Notes": "Some notes",
+                "Story points": 3,
+            }
+        })
+    
+    def test_empty_multi_value_kept(self):
+        """Test that an empty multi-value field is kept as an empty list."""
+        issue = {"customFields": [{"name": "Tags", "value": []}]}
+        self.assertEqual(_compact_issue(issue), {"customFields": {"Tags": []}})
+    
+    def test_non_dict_passed_through(self):
+        """Test that anything other than an issue object is returned unchanged."""
+        self.assertIsNone(_compact_issue(None))
+        self.assertEqual(_compact_issue([]), [])
+
+
+class TestGetIssues(unittest.TestCase):
+    """Test cases for the get_issues tool."""
+    
+    def test_empty_list_makes_no_request(self):
+        """Test that no issue IDs return an empty list without a request."""
+        with patch.object(fastmcp_server.client, 'get') as mock_get:
+            result = asyncio.run(fastmcp_server.get_issues([]))
+        
+        mock_get.assert_not_called()
+        self.assertEqual(json.loads(result), [])
+    
+    def test_single_query_for_all_ids(self):
+        """Test that all issues are fetched in one request and compacted."""
+        issues = [{"$type": "Issue", "idReadable": "PRJ-1", "customFields": [{"name": "State", "value": {"name": "Open"}}]},
+                  {"$type": "Issue", "idReadable": "PRJ-2", "customFields": []}]
+        with patch.object(fastmcp_server.client, 'get', return_value=issues) as mock_get:
+            result = asyncio.run(fastmcp_server.get_issues(["PRJ-1", "PRJ-2"]))
+        
+        mock_get.assert_called_once_with("issues", params={
+            "query": "issue id: PRJ-1, PRJ-2",
+            "$top": 2,
+            "fields": fastmcp_server.ISSUE_FIELDS,
+        })
+        self.assertEqual(json.loads(result), [
+            {"idReadable": "PRJ-1", "customFields": {"State": "Open"}},
+            {"idReadable": "PRJ-2", "customFields": {}},
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
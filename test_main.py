@@ -0,0 +1,70 @@
+"""
+Tests for configuration loading in main.py.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the youtrack_mcp module to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+import main
+from youtrack_mcp.config import Config
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Test cases for load_config."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        # load_config updates the shared Config class, so restore it afterwards
+        saved = {key: getattr(Config, key) for key in main._CONFIG_KEYS}
+        self.addCleanup(Config.from_dict, saved)
+    
+    def test_environment_values_converted(self):
+        """Test that overrides are converted to the type of each setting."""
+        env = {
+            "YOUTRACK_MCP_VERIFY_SSL": "false",
+            "YOUTRACK_MCP_MAX_CONCURRENT_REQUESTS": "3",
+            "YOUTRACK_MCP_READ_TIMEOUT": "12.5",
+            "YOUTRACK_MCP_MCP_SERVER_NAME": "tracker",
+        }
+        with patch.dict(os.environ, env):
+            main.load_config()
+        
+        self.assertIs(Config.VERIFY_SSL, False)
+        self.assertEqual(Config.MAX_CONCURRENT_REQUESTS, 3)
+        self.assertIsInstance(Config.MAX_CONCURRENT_REQUESTS, int)
+        self.assertEqual(Config.READ_TIMEOUT, 12.5)
+        self.assertEqual(Config.MCP_SERVER_NAME, "tracker")
+    
+    def test_integer_value_for_float_setting(self):
+        """Test that a whole number is accepted for a float setting."""
+        with patch.dict(os.environ, {"YOUTRACK_MCP_CONNECT_TIMEOUT": "5"}):
+            main.load_config()
+        
+        self.assertEqual(Config.CONNECT_TIMEOUT, 5.0)
+        self.assertIsInstance(Config.CONNECT_TIMEOUT, float)
+    
+    def test_invalid_number_names_variable(self):
+        """Test that a non-numeric override reports the variable it came from."""
+        with patch.dict(os.environ, {"YOUTRACK_MCP_MAX_CONCURRENT_REQUESTS": "abc"}):
+            with self.assertRaisesRegex(ValueError, "YOUTRACK_MCP_MAX_CONCURRENT_REQUESTS must be an integer, got 'abc'"):
+                main.load_config()
+    
+    def test_command_line_overrides_environment(self):
+        """Test that command line values take precedence over the environment."""
+        env = {
+            "YOUTRACK_MCP_YOUTRACK_URL": "https://env.example.com",
+            "YOUTRACK_MCP_VERIFY_SSL": "true",
+        }
+        with patch.dict(os.environ, env):
+            main.load_config({"YOUTRACK_URL": "https://cli.example.com", "VERIFY_SSL": False})
+        
+        self.assertEqual(Config.YOUTRACK_URL, "https://cli.example.com")
+        self.assertIs(Config.VERIFY_SSL, False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,340 @@
+"""
+Tests for youtrack_mcp/api/work_items.py.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+# Add the youtrack_mcp module to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from youtrack_mcp.api.client import YouTrackAPIError, YouTrackClient
+from youtrack_mcp.api import work_items
+from youtrack_mcp.api.work_items import WorkItemsClient
+
+# Precondition state of an open issue
+OPEN_ISSUE = {
+    "project": {"id": "0-1", "name": "Project", "shortName": "PRJ"},
+    "customFields": [
+        {"$type": "StateIssueCustomField", "name": "State", "value": {"name": "Open", "isResolved": False}}
+    ]
+}
+
+# Precondition state of a resolved issue
+RESOLVED_ISSUE = {
+    "project": {"id": "0-1", "name": "Project", "shortName": "PRJ"},
+    "customFields": [
+        {"$type": "StateIssueCustomField", "name": "State", "value": {"name": "Done", "isResolved": True}}
+    ]
+}
+
+
+def make_response(status_code=200, body=None, headers=None):
+    """Build a requests.Response without going over the network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps({} if body is None else body).encode()
+    return response
+
+
+class TestCreateWorkItemsBulk(unittest.TestCase):
+    """Test cases for WorkItemsClient.create_work_items_bulk."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = YouTrackClient(base_url="http://youtrack.test", api_token="token")
+        self.work_items = WorkItemsClient(self.client)
+        # Seconds each issue's POST takes, and the status code it returns
+        self.post_delays = {}
+        self.post_status = {}
+        self.lock = threading.Lock()
+        self.posted = []
+        self.client.session.request = self.request
+        
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.client.close()
+    
+    def request(self, method, url, **kwargs):
+        """Answer GETs with an open issue and POSTs with a new work item."""
+        if method == "GET":
+            return make_response(200, OPEN_ISSUE)
+        issue_id = url.split("/")[-3]
+        time.sleep(self.post_delays.get(issue_id, 0))
+        with self.lock:
+            self.posted.append(issue_id)
+        status_code = self.post_status.get(issue_id, 200)
+        return make_response(status_code, {"id": f"item-{issue_id}"})
+    
+    def test_mixed_success_and_failure(self):
+        """Test that a failing item does not affect the others."""
+        self.post_status["PRJ-2"] = 500
+        items = [
+            {"issue_id": "PRJ-1", "duration": "1h"},
+            {"duration": "30m"},
+            {"issue_id": "PRJ-2", "duration": "2h"},
+            {"issue_id": "PRJ-3", "duration": "45m"},
+        ]
+        
+        results = self.work_items.create_work_items_bulk(items)
+        
+        self.assertEqual([r["success"] for r in results], [True, False, False, True])
+        self.assertEqual(results[0]["work_item"], {"id": "item-PRJ-1"})
+        self.assertIn("issue_id", results[1]["error"])
+        self.assertIn("500", results[2]["error"])
+        self.assertEqual(results[3]["work_item"], {"id": "item-PRJ-3"})
+    
+    def test_results_in_input_order(self):
+        """Test that results follow the input order, not the completion order."""
+        self.post_delays = {"PRJ-1": 0.15, "PRJ-2": 0.1, "PRJ-3": 0.05}
+        items = [{"issue_id": f"PRJ-{n}", "duration": "1h"} for n in (1, 2, 3, 4)]
+        
+        results = self.work_items.create_work_items_bulk(items, max_concurrency=4)
+        
+        self.assertEqual(self.posted[-1], "PRJ-1")
+        self.assertEqual([r["work_item"]["id"] for r in results],
+                         ["item-PRJ-1", "item-PRJ-2", "item-PRJ-3", "item-PRJ-4"])
+
+
+class TestCreateWorkItem(unittest.TestCase):
+    """Test cases for WorkItemsClient.create_work_item."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = YouTrackClient(base_url="http://youtrack.test", api_token="token")
+        self.work_items = WorkItemsClient(self.client)
+        self.issue = OPEN_ISSUE
+        # Status code the server answers a POST body with
+        self.post_status = lambda body: 200
+        self.gets = []
+        self.bodies = []
+        self.client.session.request = self.request
+        
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.client.close()
+    
+    def request(self, method, url, **kwargs):
+        """Answer GETs with self.issue and POSTs according to self.post_status."""
+        if method == "GET":
+            self.gets.append(url)
+            return make_response(200, self.issue)
+        body = json.loads(kwargs["data"])
+        self.bodies.append(body)
+        status_code = self.post_status(body)
+        if status_code >= 400:
+            return make_response(status_code, {"error": f"{self.duration_format(body)} rejected"})
+        return make_response(status_code, {"id": "item-1"})
+    
+    @staticmethod
+    def duration_format(body):
+        """Name of the duration format a POST body uses."""
+        duration = body.get("duration")
+        if isinstance(duration, str):
+            return "string"
+        if isinstance(duration, dict):
+            return next(iter(duration))
+        return None
+    
+    def posted_formats(self):
+        """Duration formats of the POSTs sent so far, in order."""
+        return [self.duration_format(body) for body in self.bodies]
+    
+    def test_saved_format_falls_back_on_400(self):
+        """Test that the remembered format does not stop other formats being tried."""
+        # The server only reads a bare number in the minutes format
+        self.post_status = lambda body: 400 if body["duration"] in ({"presentation": "45"}, "45") else 200
+        
+        self.work_items.create_work_item("PRJ-1", "1h")
+        result = self.work_items.create_work_item("PRJ-1", "45")
+        
+        self.assertEqual(result, {"id": "item-1"})
+        self.assertEqual(self.posted_formats(), ["presentation", "presentation", "string", "minutes"])
+        self.assertEqual(self.bodies[-1]["duration"], {"minutes": 45})
+    
+    def test_first_accepted_format_wins(self):
+        """Test that formats are tried in order until one is accepted."""
+        self.post_status = lambda body: 400 if self.duration_format(body) == "presentation" else 200
+        
+        result = self.work_items.create_work_item("PRJ-1", "1h 30m", text="Review")
+        
+        self.assertEqual(result, {"id": "item-1"})
+        self.assertEqual(self.posted_formats(), ["presentation", "string"])
+        self.assertEqual(self.bodies[-1], {"duration": "1h 30m", "text": "Review"})
+    
+    def test_all_formats_rejected(self):
+        """Test that the first rejection is raised once every format got a 400."""
+        self.post_status = lambda body: 400
+        
+        with self.assertRaises(YouTrackAPIError) as cm:
+            self.work_items.create_work_item("PRJ-1", "1h")
+        
+        self.assertEqual(cm.exception.status_code, 400)
+        self.assertIn("presentation rejected", str(cm.exception))
+        self.assertEqual(self.posted_formats(), ["presentation", "string", "minutes"])
+    
+    def test_non_400_stops_cascade(self):
+        """Test that a status other than 400 is raised without trying other formats."""
+        self.post_status = lambda body: 500
+        
+        with self.assertRaises(YouTrackAPIError) as cm:
+            self.work_items.create_work_item("PRJ-1", "1h")
+        
+        self.assertEqual(cm.exception.status_code, 500)
+        self.assertEqual(self.posted_formats(), ["presentation"])
+    
+    def test_resolved_issue_rejected(self):
+        """Test that a resolved issue is rejected before anything is posted."""
+        self.issue = RESOLVED_ISSUE
+        
+        with self.assertRaisesRegex(ValueError, "resolved ticket 'PRJ-1'"):
+            self.work_items.create_work_item("PRJ-1", "1h")
+        
+        self.assertEqual(len(self.gets), 1)
+        self.assertEqual(self.bodies, [])
+    
+    def test_skip_preconditions_posts_without_get(self):
+        """Test that skip_preconditions posts straight away."""
+        result = self.work_items.create_work_item("PRJ-1", "1h", skip_preconditions=True)
+        
+        self.assertEqual(result, {"id": "item-1"})
+        self.assertEqual(self.gets, [])
+        self.assertEqual(self.posted_formats(), ["presentation"])
+    
+    def test_skip_preconditions_explains_rejection(self):
+        """Test that a rejected POST on a resolved issue raises the precondition error."""
+        self.issue = RESOLVED_ISSUE
+        self.post_status = lambda body: 400
+        
+        with self.assertRaisesRegex(ValueError, "resolved ticket 'PRJ-1'"):
+            self.work_items.create_work_item("PRJ-1", "1h", skip_preconditions=True)
+        
+        self.assertEqual(len(self.gets), 1)
+        self.assertEqual(self.posted_formats(), ["presentation", "string", "minutes"])
+    
+    def test_empty_duration_rejected(self):
+        """Test that a missing duration is rejected without any request."""
+        for duration in ("", None):
+            with self.assertRaisesRegex(ValueError, "A duration is required"):
+                self.work_items.create_work_item("PRJ-1", duration)
+        
+        self.assertEqual(self.gets, [])
+        self.assertEqual(self.bodies, [])
+    
+    def test_invalid_duration_rejected(self):
+        """Test that a duration without a number is rejected without any request."""
+        with self.assertRaisesRegex(ValueError, "Invalid duration 'soon'"):
+            self.work_items.create_work_item("PRJ-1", "soon")
+        
+        self.assertEqual(self.gets, [])
+        self.assertEqual(self.bodies, [])
+
+
+class TestPreconditionCache(unittest.TestCase):
+    """Test cases for the precondition state cache."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = MagicMock()
+        self.client.get.side_effect = lambda path, params: {"path": path}
+        self.work_items = WorkItemsClient(self.client)
+        self.now = 1000.0
+        patcher = patch('youtrack_mcp.api.work_items.time.monotonic', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_hit_within_ttl(self):
+        """Test that a second fetch within the TTL reuses the first result."""
+        first = self.work_items._fetch_precondition_state("PRJ-1")
+        self.now += work_items._PRECONDITION_TTL - 1
+        second = self.work_items._fetch_precondition_state("PRJ-1")
+        
+        self.assertIs(second, first)
+        self.assertEqual(self.client.get.call_count, 1)
+    
+    def test_refetch_after_ttl(self):
+        """Test that an expired entry is fetched again."""
+        self.work_items._fetch_precondition_state("PRJ-1")
+        self.now += work_items._PRECONDITION_TTL
+        self.work_items._fetch_precondition_state("PRJ-1")
+        
+        self.assertEqual(self.client.get.call_count, 2)
+    
+    def test_failed_fetch_not_cached(self):
+        """Test that an error is not cached and the next call retries."""
+        self.client.get.side_effect = [YouTrackAPIError("Server error", 500), {"id": "2-1"}]
+        
+        with self.assertRaises(YouTrackAPIError):
+            self.work_items._fetch_precondition_state("PRJ-1")
+        result = self.work_items._fetch_precondition_state("PRJ-1")
+        
+        self.assertEqual(result, {"id": "2-1"})
+        self.assertEqual(self.client.get.call_count, 2)
+    
+    def test_evicts_oldest_at_maxsize(self):
+        """Test that the oldest entry is evicted once the cache is full."""
+        with patch('youtrack_mcp.api.work_items._PRECONDITION_MAXSIZE', 3):
+            for n in (1, 2, 3):
+                self.work_items._fetch_precondition_state(f"PRJ-{n}")
+            # Refreshing an entry makes it the newest
+            self.now += work_items._PRECONDITION_TTL
+            self.work_items._fetch_precondition_state("PRJ-1")
+            self.work_items._fetch_precondition_state("PRJ-4")
+        
+        self.assertEqual(list(self.work_items._precondition_cache), ["PRJ-3", "PRJ-1", "PRJ-4"])
+
+
+class TestIterWorkItems(unittest.TestCase):
+    """Test cases for WorkItemsClient.iter_work_items."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = MagicMock()
+        self.work_items = WorkItemsClient(self.client)
+    
+    def serve(self, count):
+        """Answer paged GETs from a list of count work items."""
+        items = [{"id": f"item-{n}"} for n in range(count)]
+        self.client.get.side_effect = lambda path, params: items[params["$skip"]:params["$skip"] + params["$top"]]
+        return items
+    
+    def pages_requested(self):
+        """The $skip of each GET made so far."""
+        return [c.kwargs["params"]["$skip"] for c in self.client.get.call_args_list]
+    
+    def test_no_items(self):
+        """Test that an empty first page ends the iteration."""
+        self.serve(0)
+        self.assertEqual(list(self.work_items.iter_work_items("PRJ-1", page_size=2)), [])
+        self.assertEqual(self.pages_requested(), [0])
+    
+    def test_exactly_one_page(self):
+        """Test that a full page is followed by one more request."""
+        items = self.serve(2)
+        self.assertEqual(list(self.work_items.iter_work_items("PRJ-1", page_size=2)), items)
+        self.assertEqual(self.pages_requested(), [0, 2])
+    
+    def test_several_pages(self):
+        """Test that pages are requested until a short one arrives."""
+        items = self.serve(5)
+        self.assertEqual(list(self.work_items.iter_work_items("PRJ-1", page_size=2)), items)
+        self.assertEqual(self.pages_requested(), [0, 2, 4])
+    
+    def test_non_positive_page_size_rejected(self):
+        """Test that a page size of zero or less is rejected."""
+        self.serve(5)
+        for page_size in (0, -1):
+            with self.assertRaises(ValueError):
+                list(self.work_items.iter_work_items("PRJ-1", page_size=page_size))
+        self.client.get.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,38 +7,90 @@ If no local file is found, all parent tickets are allowed.
 """
 import os
 import logging
-import json
+import sys
+
+# Optional import for orjson, falling back to the stdlib parser
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+# Optional import for ijson, used to extract only the tickets array
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Parsed result of the last load, keyed on the file's (path, mtime, size)
+_cache = {"key": None, "value": None}
+
+
+def clear_cache():
+    """Forget the cached parent tickets so the next load re-reads the file."""
+    _cache["key"] = None
+    _cache["value"] = None
+
+
 # Check for a local parent-ticket.json file
-def load_allowed_parent_tickets():
+def load_allowed_parent_tickets(path: str = 'parent-ticket.json'):
     """
     Load allowed parent tickets from a local file if it exists.
     If the file doesn't exist, return None to indicate that all tickets are allowed.
     
+    The parsed result is cached and only re-read when the file's modification
+    time or size changes.
+    
+    Args:
+        path: Path of the parent tickets file
+        
     Returns:
-        List of allowed ticket IDs or None if all tickets are allowed
+        Tuple of allowed ticket IDs or None if all tickets are allowed
     """
-    parent_tickets_file = 'parent-ticket.json'
-    
-    if os.path.exists(parent_tickets_file):
-        try:
-            with open(parent_tickets_file, 'r') as f:
-                # Read ticket IDs from JSON file
-                data = json.load(f)
-                tickets = data.get('tickets', [])
-                logger.info(f"Loaded {len(tickets)} parent tickets from {parent_tickets_file}")
-                return tickets
-        except Exception as e:
-            logger.error(f"Error reading parent tickets file: {str(e)}")
-            # Return empty list if there's an error reading the file
-            return []
-    else:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         # If no file exists, return None to indicate all tickets are allowed
-        logger.info(f"No {parent_tickets_file} found, all parent tickets will be allowed")
+        logger.info(f"No {path} found, all parent tickets will be allowed")
         return None
+    
+    key = (path, st.st_mtime_ns, st.st_size)
+    if key == _cache["key"]:
+        return _cache["value"]
+    
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        
+        # Content that cannot start a JSON document is rejected without parsing
+        if not raw.lstrip().startswith((b'{', b'[')):
+            logger.error(f"Error reading parent tickets file: {path} does not contain a JSON document")
+            _cache["key"] = key
+            _cache["value"] = ()
+            return ()
+        
+        # Read ticket IDs from JSON file
+        if ijson is not None:
+            tickets = list(ijson.items(raw, 'tickets.item'))
+        else:
+            data = orjson.loads(raw)
+            tickets = data.get('tickets', [])
+        # Ticket IDs are compared against issue IDs on every work item call
+        tickets = [sys.intern(t) for t in tickets if isinstance(t, str)]
+        logger.info(f"Loaded {len(tickets)} parent tickets from {path}")
+    except Exception as e:
+        logger.error(f"Error reading parent tickets file: {str(e)}")
+        # Return an empty tuple if there's an error reading the file
+        return ()
+    
+    _cache["key"] = key
+    _cache["value"] = tuple(tickets) if tickets else None
+    return _cache["value"]
 
 # Load parent tickets from file or use None (all tickets allowed)
 
 ALLOWED_PARENT_TICKETS = load_allowed_parent_tickets()
+
+# Set form of the allowed tickets for constant-time membership checks
+ALLOWED_PARENT_TICKETS_SET = frozenset(ALLOWED_PARENT_TICKETS) if ALLOWED_PARENT_TICKETS else None
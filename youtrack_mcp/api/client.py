@@ -2,17 +2,48 @@
 Base client for YouTrack REST API.
 """
 import logging
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 import json
 
 import requests
+from requests.adapters import HTTPAdapter
 from pydantic import BaseModel, Field, model_validator
 
 from youtrack_mcp.config import config
 
+# Optional import for orjson, used to serialize request bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Methods that are safe to resend after a request timed out
+_IDEMPOTENT_METHODS = frozenset(("GET", "PUT", "DELETE"))
+
+# Rate limit reset values above these are epoch timestamps in seconds or in
+# milliseconds rather than a number of seconds to wait
+_EPOCH_THRESHOLD = 1e9
+_EPOCH_MS_THRESHOLD = 1e12
+
+
+def encode_json(payload: Any) -> bytes:
+    """
+    Serialize a request body to JSON bytes.
+    
+    Args:
+        payload: JSON-serializable request body
+        
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
 
 class YouTrackAPIError(Exception):
     """Base exception for YouTrack API errors."""
@@ -43,6 +74,11 @@ class PermissionDeniedError(YouTrackAPIError):
     pass
 
 
+class RequestTimeoutError(YouTrackAPIError, TimeoutError):
+    """Exception for requests that received no response in time."""
+    pass
+
+
 class ValidationError(YouTrackAPIError):
     """Exception for validation errors in API requests."""
     pass
@@ -69,7 +105,8 @@ class YouTrackClient:
     """Base client for YouTrack REST API."""
     
     def __init__(self, base_url: Optional[str] = None, api_token: Optional[str] = None, 
-                 verify_ssl: Optional[bool] = None, max_retries: int = 3, retry_delay: float = 1.0):
+                 verify_ssl: Optional[bool] = None, max_retries: int = 3, retry_delay: float = 1.0,
+                 timeout: Optional[Tuple[float, float]] = None):
         """
         Initialize YouTrack API client.
         
@@ -79,12 +116,20 @@ class YouTrackClient:
             verify_ssl: Whether to verify SSL certificates, defaults to config.VERIFY_SSL
             max_retries: Maximum number of retries for transient errors
             retry_delay: Initial delay between retries in seconds (increases exponentially)
+            timeout: (connect, read) timeouts in seconds, defaults to config.CONNECT_TIMEOUT and config.READ_TIMEOUT
         """
         self.base_url = base_url or config.get_base_url()
         self.api_token = api_token or config.YOUTRACK_API_TOKEN
         self.verify_ssl = verify_ssl if verify_ssl is not None else config.VERIFY_SSL
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.timeout = timeout or (config.CONNECT_TIMEOUT, config.READ_TIMEOUT)
+        
+        # Bound on requests in flight, and the time until which the server
+        # asked us to hold off
+        self._request_slots = threading.BoundedSemaphore(config.MAX_CONCURRENT_REQUESTS)
+        self._pause_until = 0.0
+        self.max_rate_limit_wait = config.MAX_RATE_LIMIT_WAIT
         
         # Validate required configuration
         if not self.api_token:
@@ -92,6 +137,11 @@ class YouTrackClient:
         
         # Session for connection pooling and header reuse
         self.session = requests.Session()
+        # Keep a pooled connection for every request that may be in flight at
+        # once; retries are handled by _make_request, not urllib3
+        adapter = HTTPAdapter(pool_maxsize=config.MAX_CONCURRENT_REQUESTS, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Authorization": f"Bearer {self.api_token}",
             "Accept": "application/json",
@@ -180,6 +230,62 @@ class YouTrackClient:
         else:
             raise YouTrackAPIError(error_message, status_code, response)
     
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a single request within the concurrency limit.
+        
+        Waits out any pause requested by the server's rate limit headers
+        before sending.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            url: Full API URL
+            **kwargs: Additional arguments to pass to requests
+            
+        Returns:
+            Response from API
+        """
+        # Wait before taking a slot so a pause does not hold up the others
+        wait = self._pause_until - time.monotonic()
+        if wait > 0:
+            logger.debug(f"Rate limit reached, waiting {wait:.2f}s before {method} {url}")
+            time.sleep(wait)
+        
+        with self._request_slots:
+            response = self.session.request(method, url, **kwargs)
+        
+        self._note_rate_limit(response)
+        return response
+    
+    def _note_rate_limit(self, response: requests.Response) -> None:
+        """
+        Pause further requests when the server reports its rate limit is exhausted.
+        
+        The pause is capped at max_rate_limit_wait seconds.
+        
+        Args:
+            response: Response from API
+        """
+        headers = response.headers
+        delay = headers.get("Retry-After")
+        if delay is None and headers.get("X-RateLimit-Remaining") == "0":
+            delay = headers.get("X-RateLimit-Reset")
+        if delay is None:
+            return
+        
+        try:
+            delay = float(delay)
+        except (TypeError, ValueError):
+            # HTTP-date values are not supported; the retry backoff still applies
+            return
+        if delay > _EPOCH_MS_THRESHOLD:
+            delay = delay / 1000 - time.time()
+        elif delay > _EPOCH_THRESHOLD:
+            delay -= time.time()
+        if delay > 0:
+            delay = min(delay, self.max_rate_limit_wait)
+            self._pause_until = max(self._pause_until, time.monotonic() + delay)
+    
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """
         Make API request with retry logic for transient errors.
@@ -196,6 +302,14 @@ class YouTrackClient:
             YouTrackAPIError: For non-transient errors or if all retries fail
         """
         url = self._get_api_url(endpoint)
+        
+        # Serialize JSON bodies once up front; retries resend the same bytes
+        if kwargs.get("json") is not None and kwargs.get("data") is None:
+            kwargs["data"] = encode_json(kwargs.pop("json"))
+        
+        # Never wait on an unresponsive server indefinitely
+        kwargs.setdefault("timeout", self.timeout)
+        
         retries = 0
         delay = self.retry_delay
         last_error = None
@@ -203,7 +317,7 @@ class YouTrackClient:
         while retries <= self.max_retries:
             try:
                 logger.debug(f"Making {method} request to {url}")
-                response = self.session.request(method, url, **kwargs)
+                response = self._send(method, url, **kwargs)
                 return self._handle_response(response)
             except (RateLimitError, ServerError) as e:
                 # Retry transient errors
@@ -223,7 +337,14 @@ class YouTrackClient:
                 raise
             except requests.RequestException as e:
                 # Handle connection errors
-                last_error = YouTrackAPIError(f"Request failed: {str(e)}")
+                if isinstance(e, requests.Timeout):
+                    last_error = RequestTimeoutError(f"Request timed out: {str(e)}")
+                    # A request that timed out after being sent may already have been applied
+                    if method not in _IDEMPOTENT_METHODS and not isinstance(e, requests.ConnectTimeout):
+                        logger.error(f"Request timed out for {method} {url}")
+                        raise last_error
+                else:
+                    last_error = YouTrackAPIError(f"Request failed: {str(e)}")
                 retries += 1
                 
                 if retries <= self.max_retries:
@@ -268,6 +389,38 @@ class YouTrackClient:
         """
         return self._make_request("POST", endpoint, data=data, json=json_data, **kwargs)
     
+    def post_raw(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
+        """
+        Make a single POST request and return the raw response.
+        
+        Unlike post, error statuses are not raised and the request is not
+        retried, so callers can inspect the status code themselves.
+        
+        Args:
+            endpoint: API endpoint
+            json_data: JSON data
+            **kwargs: Additional arguments to pass to requests
+            
+        Returns:
+            Response from API
+            
+        Raises:
+            RequestTimeoutError: If no response arrives in time
+            YouTrackAPIError: If the request cannot be sent
+        """
+        url = self._get_api_url(endpoint)
+        if json_data is not None:
+            kwargs["data"] = encode_json(json_data)
+        kwargs.setdefault("timeout", self.timeout)
+        
+        try:
+            logger.debug(f"Making POST request to {url}")
+            return self._send("POST", url, **kwargs)
+        except requests.Timeout as e:
+            raise RequestTimeoutError(f"Request timed out: {str(e)}")
+        except requests.RequestException as e:
+            raise YouTrackAPIError(f"Request failed: {str(e)}")
+    
     def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
         """
         Make PUT request to API.
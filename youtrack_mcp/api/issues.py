@@ -30,6 +30,8 @@ class Issue(BaseModel):
 class IssuesClient:
     """Client for interacting with YouTrack Issues API."""
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: YouTrackClient):
         """
         Initialize the Issues API client.
@@ -7,6 +7,9 @@ from pydantic import BaseModel, Field
 
 from youtrack_mcp.api.client import YouTrackClient
 
+# Project fields requested by every lookup
+_PROJECT_FIELDS = "id,name,shortName,description,archived,created,updated,lead(id,name,login)"
+
 
 class Project(BaseModel):
     """Model for a YouTrack project."""
@@ -25,6 +28,8 @@ class Project(BaseModel):
 class ProjectsClient:
     """Client for interacting with YouTrack Projects API."""
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: YouTrackClient):
         """
         Initialize the Projects API client.
@@ -44,7 +49,7 @@ class ProjectsClient:
         Returns:
             List of projects
         """
-        params = {"fields": "id,name,shortName,description,archived,created,updated,lead(id,name,login)"}
+        params = {"fields": _PROJECT_FIELDS}
         if not include_archived:
             params["$filter"] = "archived eq false"
             
@@ -61,9 +66,7 @@ class ProjectsClient:
         Returns:
             The project data
         """
-        response = self.client.get(f"admin/projects/{project_id}", params={
-            "fields": "id,name,shortName,description,archived,created,updated,lead(id,name,login)"
-        })
+        response = self.client.get(f"admin/projects/{project_id}", params={"fields": _PROJECT_FIELDS})
         return Project.model_validate(response)
     
     def get_project_by_name(self, project_name: str) -> Optional[Project]:
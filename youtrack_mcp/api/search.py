@@ -9,6 +9,8 @@ from youtrack_mcp.api.client import YouTrackClient
 class SearchClient:
     """Client for advanced search operations in YouTrack."""
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: YouTrackClient):
         """
         Initialize the Search API client.
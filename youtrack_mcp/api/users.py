@@ -7,6 +7,9 @@ from pydantic import BaseModel, Field
 
 from youtrack_mcp.api.client import YouTrackClient
 
+# User fields requested by every lookup
+_USER_FIELDS = "id,login,name,email,jabber,ringId,guest,online,banned"
+
 
 class User(BaseModel):
     """Model for a YouTrack user."""
@@ -30,6 +33,8 @@ class User(BaseModel):
 class UsersClient:
     """Client for interacting with YouTrack Users API."""
     
+    __slots__ = ("client",)
+    
     def __init__(self, client: YouTrackClient):
         """
         Initialize the Users API client.
@@ -46,8 +51,7 @@ class UsersClient:
         Returns:
             The user data
         """
-        fields = "id,login,name,email,jabber,ringId,guest,online,banned"
-        response = self.client.get(f"users/me?fields={fields}")
+        response = self.client.get("users/me", params={"fields": _USER_FIELDS})
         return User.model_validate(response)
     
     def get_user(self, user_id: str) -> User:
@@ -60,8 +64,7 @@ class UsersClient:
         Returns:
             The user data
         """
-        fields = "id,login,name,email,jabber,ringId,guest,online,banned"
-        response = self.client.get(f"users/{user_id}?fields={fields}")
+        response = self.client.get(f"users/{user_id}", params={"fields": _USER_FIELDS})
         return User.model_validate(response)
     
     def search_users(self, query: str, limit: int = 10) -> List[User]:
@@ -76,8 +79,7 @@ class UsersClient:
             List of matching users
         """
         # Request additional fields to ensure we get complete user data
-        fields = "id,login,name,email,jabber,ringId,guest,online,banned"
-        params = {"query": query, "$top": limit, "fields": fields}
+        params = {"query": query, "$top": limit, "fields": _USER_FIELDS}
         response = self.client.get("users", params=params)
         
         users = []
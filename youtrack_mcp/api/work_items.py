@@ -1,12 +1,44 @@
 """
 YouTrack Work Items API client.
 """
-from typing import Any, Dict, List, Optional, Tuple
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from youtrack_mcp.api.client import YouTrackClient
-from youtrack_mcp.allowed_tickets import ALLOWED_PARENT_TICKETS
+from youtrack_mcp.api.client import YouTrackAPIError, YouTrackClient
+from youtrack_mcp.allowed_tickets import ALLOWED_PARENT_TICKETS, ALLOWED_PARENT_TICKETS_SET
+
+# Endpoint templates for the work items API
+_PATH_ISSUE = "issues/{}"
+_PATH_ITEMS = "issues/{}/timeTracking/workItems"
+_PATH_ITEM = "issues/{}/timeTracking/workItems/{}"
+
+# Issue fields read by the precondition checks, and by the time tracking check
+_PRECONDITION_FIELDS = "project(id,name,shortName),customFields($type,name,value(name,isResolved))"
+_PROJECT_FIELDS = "id,project(id,name,shortName)"
+
+# Type suffix shared by state custom fields, e.g. StateMachineIssueCustomField
+_STATE_SUFFIX = "StateIssueCustomField"
+
+# Shared pool for issuing independent read-only requests concurrently
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="youtrack-work-items")
+
+# Seconds a fetched precondition state is reused for the same issue
+_PRECONDITION_TTL = 30.0
+_PRECONDITION_MAXSIZE = 256
+
+# Duration components, e.g. "1h 30m"; a bare number is taken as minutes
+_RE_HOURS = re.compile(r'(\d+)h', re.IGNORECASE)
+_RE_MINUTES = re.compile(r'(\d+)m', re.IGNORECASE)
+_RE_NUMBER = re.compile(r'(\d+)')
+
+# Allowed tickets as listed in rejection messages
+_ALLOWED_TICKETS_JOINED = ", ".join(ALLOWED_PARENT_TICKETS) if ALLOWED_PARENT_TICKETS else ""
 
 
 class WorkItem(BaseModel):
@@ -17,7 +49,7 @@ class WorkItem(BaseModel):
     author: Optional[Dict[str, Any]] = None
     creator: Optional[Dict[str, Any]] = None
     text: Optional[str] = None
-    duration: Dict[str, Any] = Field(default_factory=dict)
+    duration: Optional[Dict[str, Any]] = None
     date: Optional[int] = None  # Timestamp in milliseconds
     type: Optional[Dict[str, Any]] = None  # Work type
     created: Optional[int] = None
@@ -25,13 +57,24 @@ class WorkItem(BaseModel):
     
     model_config = {
         "extra": "allow",  # Allow extra fields from the API
-        "populate_by_name": True  # Allow population by field name
+        "defer_build": True  # Only build the validator if the model is used
     }
 
 
 class WorkItemsClient:
     """Client for interacting with YouTrack Work Items API."""
     
+    __slots__ = ("client", "_work_item_format", "_precondition_cache", "_precondition_lock")
+    
+    # Builders for the request body in each duration format YouTrack
+    # accepts, in the order they are tried. A builder returns None when the
+    # duration cannot be expressed in its format.
+    _DURATION_FORMATS = {
+        "presentation": lambda self, duration: {"duration": {"presentation": duration}},
+        "string": lambda self, duration: {"duration": duration},
+        "minutes": lambda self, duration: self._convert_to_minutes_format(duration),
+    }
+    
     def __init__(self, client: YouTrackClient):
         """
         Initialize the Work Items API client.
@@ -40,6 +83,11 @@ class WorkItemsClient:
             client: The YouTrack API client
         """
         self.client = client
+        # Duration format the server accepted for work item creation, once known
+        self._work_item_format: Optional[str] = None
+        # Recently fetched precondition state per issue, as (fetched_at, issue)
+        self._precondition_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._precondition_lock = threading.Lock()
     
     def get_work_items(self, issue_id: str) -> List[Dict[str, Any]]:
         """
@@ -51,8 +99,38 @@ class WorkItemsClient:
         Returns:
             List of work items
         """
-        response = self.client.get(f"issues/{issue_id}/timeTracking/workItems")
-        return response
+        return list(self.iter_work_items(issue_id))
+    
+    def iter_work_items(self, issue_id: str, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the work items of an issue, fetching them page by page.
+        
+        Callers that stop iterating early never request the remaining pages.
+        
+        Args:
+            issue_id: The issue ID or readable ID (e.g., PROJECT-123)
+            page_size: Number of work items requested per API call
+            
+        Yields:
+            Work item data
+            
+        Raises:
+            ValueError: If page_size is not positive
+        """
+        # Paging stops on a short page, which a non-positive size never returns
+        if page_size <= 0:
+            raise ValueError(f"page_size must be positive, got {page_size}")
+        
+        path = _PATH_ITEMS.format(issue_id)
+        skip = 0
+        while True:
+            page = self.client.get(path, params={"$skip": skip, "$top": page_size})
+            yield from page
+            
+            # A short page means there is nothing left to fetch
+            if len(page) < page_size:
+                return
+            skip += page_size
     
     def is_parent_ticket_allowed(self, issue_id: str) -> bool:
         """
@@ -67,11 +145,7 @@ class WorkItemsClient:
             False otherwise
         """
         # If ALLOWED_PARENT_TICKETS is None or empty, all tickets are allowed
-        if ALLOWED_PARENT_TICKETS is None or len(ALLOWED_PARENT_TICKETS) == 0:
-            return True
-        
-        # Otherwise, check if the issue ID is in the allowed list
-        return issue_id in ALLOWED_PARENT_TICKETS
+        return ALLOWED_PARENT_TICKETS_SET is None or issue_id in ALLOWED_PARENT_TICKETS_SET
         
     def is_ticket_resolved(self, issue_id: str) -> Tuple[bool, Optional[str]]:
         """
@@ -89,45 +163,84 @@ class WorkItemsClient:
             - An optional string message with details (state name or error message)
         """
         try:
-            # Fetch the issue details from the API with fields that include state information
-            fields = "$type,id,summary,customFields($type,id,name,value($type,id,name,isResolved))"
-            response = self.client.get(f"issues/{issue_id}?fields={fields}")
-            
-            # Check if the response contains the necessary fields
-            if "customFields" not in response:
-                return False, "Could not fetch state fields for the issue"
-                
-            # Look for state-type fields and check if all are resolved
-            state_fields = [field for field in response["customFields"] 
-                           if field.get("$type", "").endswith("StateIssueCustomField")]
-            
-            # If no state fields found, assume the ticket is open
-            if not state_fields:
-                return False, "No state fields found for the issue"
-                
-            # Check each state field for resolution status
-            for field in state_fields:
-                if "value" in field and field["value"] is not None:
-                    value = field["value"]
-                    is_resolved = value.get("isResolved", False)
-                    field_name = field.get("name", "State")
-                    state_name = value.get("name", "Unknown")
-                    
-                    # If any state field is not resolved, the ticket is considered open
-                    if not is_resolved:
-                        return False, f"Issue has state '{state_name}' in field '{field_name}' which is not resolved"
-                else:
-                    # If a state field has no value, consider it not resolved
-                    field_name = field.get("name", "State")
-                    return False, f"Issue has no value for state field '{field_name}'"
-            
-            # If we reach here, all state fields are resolved
-            return True, "All state fields are resolved"
-            
+            issue = self._fetch_precondition_state(issue_id)
+            return self._resolution_status(issue)
         except Exception as e:
             # In case of error, assume the ticket is open
             return False, f"Error checking ticket status: {str(e)}"
     
+    def _fetch_precondition_state(self, issue_id: str) -> Dict[str, Any]:
+        """
+        Fetch the project and state fields of an issue in a single request.
+        
+        Results are reused for a short time so that bursts of calls against
+        the same issue issue a single GET.
+        
+        Args:
+            issue_id: The issue ID or readable ID (e.g., PROJECT-123)
+            
+        Returns:
+            Issue data with project and custom field information
+        """
+        now = time.monotonic()
+        with self._precondition_lock:
+            cached = self._precondition_cache.get(issue_id)
+        if cached is not None and now - cached[0] < _PRECONDITION_TTL:
+            return cached[1]
+        
+        issue = self.client.get(_PATH_ISSUE.format(issue_id), params={"fields": _PRECONDITION_FIELDS})
+        with self._precondition_lock:
+            # Re-insert refreshed entries so the oldest entry stays first
+            self._precondition_cache.pop(issue_id, None)
+            if len(self._precondition_cache) >= _PRECONDITION_MAXSIZE:
+                # Evict the oldest entry
+                self._precondition_cache.pop(next(iter(self._precondition_cache)))
+            self._precondition_cache[issue_id] = (now, issue)
+        return issue
+    
+    def _resolution_status(self, issue: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """
+        Determine whether an issue is resolved from its state fields.
+        
+        Args:
+            issue: Issue data as returned by _fetch_precondition_state
+            
+        Returns:
+            A tuple containing:
+            - A boolean indicating if the ticket is resolved (True) or not (False)
+            - An optional string message with details
+        """
+        # Check if the response contains the necessary fields
+        if "customFields" not in issue:
+            return False, "Could not fetch state fields for the issue"
+            
+        # Walk the state-type fields once, stopping at the first unresolved one
+        found_state_field = False
+        for field in issue["customFields"]:
+            field_type = field.get("$type")
+            if field_type is None or not field_type.endswith(_STATE_SUFFIX):
+                continue
+            found_state_field = True
+            
+            value = field.get("value")
+            if value is None:
+                # If a state field has no value, consider it not resolved
+                field_name = field.get("name", "State")
+                return False, f"Issue has no value for state field '{field_name}'"
+            
+            # If any state field is not resolved, the ticket is considered open
+            if not value.get("isResolved", False):
+                field_name = field.get("name", "State")
+                state_name = value.get("name", "Unknown")
+                return False, f"Issue has state '{state_name}' in field '{field_name}' which is not resolved"
+        
+        # If no state fields found, assume the ticket is open
+        if not found_state_field:
+            return False, "No state fields found for the issue"
+        
+        # If we reach here, all state fields are resolved
+        return True, "All state fields are resolved"
+    
     def is_time_tracking_enabled(self, issue_id: str) -> Tuple[bool, Optional[str]]:
         """
         Check if time tracking is enabled for the issue's project.
@@ -140,10 +253,16 @@ class WorkItemsClient:
             - A boolean indicating if time tracking is enabled
             - An optional string message with details
         """
+        # The project lookup and the work items probe don't depend on each
+        # other, so issue both requests at once
+        issue_future = _EXECUTOR.submit(self.client.get, _PATH_ISSUE.format(issue_id),
+                                        params={"fields": _PROJECT_FIELDS})
+        probe_future = _EXECUTOR.submit(self.client.get, _PATH_ITEMS.format(issue_id),
+                                        params={"$top": 1})
+        
         try:
             # Get issue details with project information
-            fields = "id,project(id,name,shortName)"
-            issue_response = self.client.get(f"issues/{issue_id}?fields={fields}")
+            issue_response = issue_future.result()
             
             if "project" not in issue_response:
                 return False, "Could not fetch project information for the issue"
@@ -157,34 +276,51 @@ class WorkItemsClient:
             # Try to get time tracking settings for the project
             try:
                 # Check if we can access time tracking by trying to get work items
-                self.client.get(f"issues/{issue_id}/timeTracking/workItems?$top=1")
+                probe_future.result()
                 return True, "Time tracking is available"
+            except YouTrackAPIError as e:
+                if e.status_code == 400:
+                    return False, self._time_tracking_disabled_message(project)
+                return False, f"Error checking time tracking availability: {str(e)}"
             except Exception as e:
+                # Last resort for errors raised outside the API client
                 error_str = str(e).lower()
                 if "400" in error_str or "bad request" in error_str:
-                    project_name = project.get("name") or project.get("shortName", "Unknown")
-                    return False, f"Time tracking is disabled for project '{project_name}'. Please enable it in YouTrack project settings."
-                else:
-                    return False, f"Error checking time tracking availability: {str(e)}"
+                    return False, self._time_tracking_disabled_message(project)
+                return False, f"Error checking time tracking availability: {str(e)}"
                     
         except Exception as e:
             return False, f"Error checking time tracking settings: {str(e)}"
 
+    @staticmethod
+    def _time_tracking_disabled_message(project: Dict[str, Any]) -> str:
+        """Message explaining that time tracking is disabled for a project."""
+        project_name = project.get("name") or project.get("shortName", "Unknown")
+        return f"Time tracking is disabled for project '{project_name}'. Please enable it in YouTrack project settings."
+    
     def create_work_item(self, 
                          issue_id: str, 
                          duration: str,
                          text: Optional[str] = None,
                          work_type: Optional[str] = None,
-                         date: Optional[int] = None) -> Dict[str, Any]:
+                         date: Optional[int] = None,
+                         skip_preconditions: bool = False) -> Dict[str, Any]:
         """
         Create a new work item for an issue.
         
+        By default the issue's project and state are checked before posting.
+        With skip_preconditions the work item is posted straight away, and the
+        checks only run to explain a rejected POST. This saves a GET per call
+        when the issue is known to be open, at the cost of the server
+        evaluating a POST that may be rejected.
+        
         Args:
             issue_id: The issue ID or readable ID (e.g., PROJECT-123)
             duration: The work duration in human-readable format (e.g., "1h 30m", "45m")
             text: Optional description of the work
             work_type: Optional work type ID
             date: Optional timestamp for the work item (defaults to current time)
+            skip_preconditions: Post without checking the issue's project and state first
             
         Returns:
             The created work item data
@@ -192,113 +328,153 @@ class WorkItemsClient:
         Raises:
             ValueError: If the issue ID is not in the list of allowed parent tickets
             ValueError: If the issue is resolved/closed and time tracking is not allowed
-            ValueError: If time tracking is disabled for the project
+            ValueError: If the issue's project or state cannot be fetched
+            ValueError: If no duration is given, or it contains no number
+            YouTrackAPIError: If the server rejects the work item, e.g. when
+                time tracking is disabled for the project
+            RequestTimeoutError: If the POST times out
         """
+        issue_id = sys.intern(issue_id)
+        
         # Check if the issue ID is in the allowed list
         if not self.is_parent_ticket_allowed(issue_id):
-            # If ALLOWED_PARENT_TICKETS is not None and not empty, show the list of allowed tickets
-            if ALLOWED_PARENT_TICKETS is not None and len(ALLOWED_PARENT_TICKETS) > 0:
-                allowed_tickets = ", ".join(ALLOWED_PARENT_TICKETS)
-                raise ValueError(f"Issue ID '{issue_id}' is not in the list of allowed parent tickets. Allowed tickets: {allowed_tickets}")
-            else:
-                # This should never happen, but just in case
-                raise ValueError(f"Issue ID '{issue_id}' is not allowed, but no restrictions are defined. This is unexpected.")
-        
-        # Check if time tracking is enabled for this project
-        time_tracking_enabled, time_tracking_message = self.is_time_tracking_enabled(issue_id)
-        if not time_tracking_enabled:
-            raise ValueError(f"Cannot create work item for '{issue_id}': {time_tracking_message}")
+            # Only reachable when restrictions are defined, so the list is never empty
+            raise ValueError(f"Issue ID '{issue_id}' is not in the list of allowed parent tickets. Allowed tickets: {_ALLOWED_TICKETS_JOINED}")
+        
+        # Every format would send an empty duration, so reject it up front
+        if not duration:
+            raise ValueError(f"Cannot create work item for '{issue_id}': A duration is required")
+        # Every format needs an amount, e.g. "45", "1h 30m" or "2d"
+        if not _RE_NUMBER.search(duration):
+            raise ValueError(f"Cannot create work item for '{issue_id}': Invalid duration '{duration}'")
+        
+        # Fetch project and state information in one request. Whether time
+        # tracking is enabled is not probed separately; the POST below fails
+        # with the server's error if it is disabled for the project.
+        if not skip_preconditions:
+            try:
+                issue = self._fetch_precondition_state(issue_id)
+            except Exception as e:
+                raise ValueError(f"Cannot create work item for '{issue_id}': Error checking issue state: {str(e)}")
+            self._check_preconditions(issue_id, issue)
+        
+        # Try the format accepted last time first; the others remain as
+        # fallbacks, since a format can accept one duration and reject another
+        formats = tuple(self._DURATION_FORMATS)
+        if self._work_item_format:
+            formats = (self._work_item_format,) + tuple(f for f in formats if f != self._work_item_format)
+        
+        error_response = None
+        for fmt in formats:
+            body = self._build_work_item_body(duration, text or None, work_type, date, fmt=fmt)
+            if body is None:
+                continue
+            
+            # Raw responses let a rejected format fall through to the next one
+            response = self.client.post_raw(_PATH_ITEMS.format(issue_id), json_data=body)
+            if response.status_code == 200 or response.status_code == 201:
+                # The minutes format drops units it cannot parse, such as
+                # days, so it is never used without trying the others first
+                if fmt != "minutes":
+                    self._work_item_format = fmt
+                return response.json()
+            
+            # Responses are falsy for error statuses, so compare with None
+            if error_response is None:
+                error_response = response
+            # Only a 400 suggests the body format was rejected
+            if response.status_code != 400:
+                break
+        
+        # Explain a rejection the same way the up-front checks would have
+        if skip_preconditions and error_response.status_code in (400, 403):
+            try:
+                issue = self._fetch_precondition_state(issue_id)
+            except Exception:
+                issue = None
+            if issue is not None:
+                self._check_preconditions(issue_id, issue)
+        
+        # If all failed, raise with details of the first failure
+        raise YouTrackAPIError(f"API request failed with status {error_response.status_code}: {error_response.text}",
+                               error_response.status_code, error_response)
+    
+    def _check_preconditions(self, issue_id: str, issue: Dict[str, Any]) -> None:
+        """
+        Check that a work item can be added to an issue.
+        
+        Args:
+            issue_id: The issue ID or readable ID (e.g., PROJECT-123)
+            issue: Issue data as returned by _fetch_precondition_state
+            
+        Raises:
+            ValueError: If the issue's project is missing or the issue is resolved
+        """
+        if "project" not in issue:
+            raise ValueError(f"Cannot create work item for '{issue_id}': Could not fetch project information for the issue")
         
         # Check if the ticket is resolved (closed)
-        is_resolved, message = self.is_ticket_resolved(issue_id)
+        is_resolved, message = self._resolution_status(issue)
         if is_resolved:
             raise ValueError(f"Cannot add work items to resolved ticket '{issue_id}'. Status: {message}")
+    
+    def create_work_items_bulk(self,
+                               items: List[Dict[str, Any]],
+                               max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Create several work items concurrently.
         
-        # Try different common formats that work with YouTrack
-        data_formats = [
-            # Format 1: Standard YouTrack format with presentation
-            {
-                "duration": {"presentation": duration}
-            },
-            # Format 2: Direct duration string
-            {
-                "duration": duration
-            },
-            # Format 3: Duration with minutes conversion
-            self._convert_to_minutes_format(duration)
-        ]
-        
-        # Add optional fields to all formats
-        for data in data_formats:
-            if data is None:
-                continue
-            if text:
-                data["text"] = text
-            if work_type:
-                data["type"] = {"id": work_type}
-            if date:
-                data["date"] = date
-        
-        # Alternative: Use direct HTTP client approach
-        import requests
-        import json
-        from youtrack_mcp.config import config
-        
-        # Build direct request
-        url = f"{config.get_base_url()}/issues/{issue_id}/timeTracking/workItems"
-        headers = {
-            "Authorization": f"Bearer {config.YOUTRACK_API_TOKEN}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        
-        # Try with simple duration format first
-        simple_data = {"duration": {"presentation": duration}}
-        if text:
-            simple_data["text"] = text
+        The precondition state of each distinct issue is fetched once up
+        front, then the work items are created in parallel.
         
-        try:
-            response = requests.post(url, json=simple_data, headers=headers, verify=config.VERIFY_SSL)
-            if response.status_code == 200 or response.status_code == 201:
-                return response.json()
-            elif response.status_code == 400:
-                # Try alternative formats
-                for alt_data in [
-                    {"duration": duration, "text": text} if text else {"duration": duration},
-                    {"duration": {"minutes": self._parse_duration_to_minutes(duration)}, "text": text} if text else {"duration": {"minutes": self._parse_duration_to_minutes(duration)}}
-                ]:
-                    alt_response = requests.post(url, json=alt_data, headers=headers, verify=config.VERIFY_SSL)
-                    if alt_response.status_code in [200, 201]:
-                        return alt_response.json()
-                
-                # If all failed, raise with details
-                raise Exception(f"API request failed with status {response.status_code}: {response.text}")
-            else:
-                raise Exception(f"API request failed with status {response.status_code}: {response.text}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"HTTP request failed: {str(e)}")
+        Args:
+            items: Keyword arguments for create_work_item, one dict per work item
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            One result per item, in input order: {"success": True, "work_item": ...}
+            or {"success": False, "error": ...}
+        """
+        def fetch(issue_id: str) -> None:
+            try:
+                self._fetch_precondition_state(issue_id)
+            except Exception:
+                # create_work_item reports the error for each affected item
+                pass
+        
+        def create(item: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return {"success": True, "work_item": self.create_work_item(**item)}
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+        
+        # Items without a usable issue ID are left to fail in create
+        issue_ids = {issue_id for issue_id in (item.get("issue_id") for item in items)
+                     if isinstance(issue_id, str) and self.is_parent_ticket_allowed(issue_id)}
+        with ThreadPoolExecutor(max_workers=max_concurrency,
+                                thread_name_prefix="youtrack-work-items-bulk") as executor:
+            list(executor.map(fetch, issue_ids))
+            return list(executor.map(create, items))
     
-    def _parse_duration_to_minutes(self, duration: str) -> int:
-        """Parse duration string to total minutes."""
-        try:
-            import re
-            total_minutes = 0
-            hours_match = re.search(r'(\d+)h', duration.lower())
-            minutes_match = re.search(r'(\d+)m', duration.lower())
-            
-            if hours_match:
-                total_minutes += int(hours_match.group(1)) * 60
-            if minutes_match:
-                total_minutes += int(minutes_match.group(1))
-            
-            if total_minutes == 0:
-                number_match = re.search(r'(\d+)', duration)
-                if number_match:
-                    total_minutes = int(number_match.group(1))
-            
-            return total_minutes if total_minutes > 0 else 60  # Default to 1 hour
-        except:
-            return 60  # Default fallback
+    @staticmethod
+    def _parse_minutes(duration: str) -> int:
+        """Parse a duration string to total minutes, or 0 if none are found."""
+        total_minutes = 0
+        hours_match = _RE_HOURS.search(duration)
+        minutes_match = _RE_MINUTES.search(duration)
+        
+        if hours_match:
+            total_minutes += int(hours_match.group(1)) * 60
+        if minutes_match:
+            total_minutes += int(minutes_match.group(1))
+        
+        # If no time found, try parsing as pure number (assume minutes)
+        if total_minutes == 0:
+            number_match = _RE_NUMBER.search(duration)
+            if number_match:
+                total_minutes = int(number_match.group(1))
+        
+        return total_minutes
     
     def _convert_to_minutes_format(self, duration: str) -> Optional[Dict[str, Any]]:
         """
@@ -310,34 +486,17 @@ class WorkItemsClient:
         Returns:
             Dictionary with minutes format or None if conversion fails
         """
-        try:
-            import re
-            total_minutes = 0
-            
-            # Parse hours and minutes from duration string
-            hours_match = re.search(r'(\d+)h', duration.lower())
-            minutes_match = re.search(r'(\d+)m', duration.lower())
-            
-            if hours_match:
-                total_minutes += int(hours_match.group(1)) * 60
-            if minutes_match:
-                total_minutes += int(minutes_match.group(1))
-            
-            # If no time found, try parsing as pure number (assume minutes)
-            if total_minutes == 0:
-                number_match = re.search(r'(\d+)', duration)
-                if number_match:
-                    total_minutes = int(number_match.group(1))
-            
-            if total_minutes > 0:
-                return {
-                    "duration": {
-                        "minutes": total_minutes
-                    }
-                }
-            return None
-        except:
+        if not duration:
             return None
+        
+        total_minutes = self._parse_minutes(duration)
+        if total_minutes > 0:
+            return {
+                "duration": {
+                    "minutes": total_minutes
+                }
+            }
+        return None
     
     def update_work_item(self,
                          issue_id: str,
@@ -360,10 +519,41 @@ class WorkItemsClient:
         Returns:
             The updated work item data
         """
+        data = self._build_work_item_body(duration, text, work_type, date)
+        
+        if not data:
+            # Nothing to update
+            return self.get_work_item(issue_id, work_item_id)
+            
+        response = self.client.post(_PATH_ITEM.format(issue_id, work_item_id), json_data=data)
+        return response
+    
+    def _build_work_item_body(self,
+                              duration: Optional[str],
+                              text: Optional[str],
+                              work_type: Optional[str],
+                              date: Optional[int],
+                              *,
+                              fmt: str = "presentation") -> Optional[Dict[str, Any]]:
+        """
+        Build the request body for creating or updating a work item.
+        
+        Args:
+            duration: Work duration in human-readable format, omitted if empty
+            text: Description of the work, omitted if None
+            work_type: Work type ID, omitted if empty
+            date: Timestamp for the work item, omitted if empty
+            fmt: Key of _DURATION_FORMATS used to express the duration
+            
+        Returns:
+            The request body, or None if the duration cannot be expressed in fmt
+        """
         data = {}
         
         if duration:
-            data["duration"] = {"presentation": duration}
+            data = self._DURATION_FORMATS[fmt](self, duration)
+            if data is None:
+                return None
             
         if text is not None:
             data["text"] = text
@@ -374,12 +564,7 @@ class WorkItemsClient:
         if date:
             data["date"] = date
             
-        if not data:
-            # Nothing to update
-            return self.get_work_item(issue_id, work_item_id)
-            
-        response = self.client.post(f"issues/{issue_id}/timeTracking/workItems/{work_item_id}", data=data)
-        return response
+        return data
     
     def delete_work_item(self, issue_id: str, work_item_id: str) -> Dict[str, Any]:
         """
@@ -392,7 +577,7 @@ class WorkItemsClient:
         Returns:
             Empty response or error information
         """
-        return self.client.delete(f"issues/{issue_id}/timeTracking/workItems/{work_item_id}")
+        return self.client.delete(_PATH_ITEM.format(issue_id, work_item_id))
     
     def get_work_item(self, issue_id: str, work_item_id: str) -> Dict[str, Any]:
         """
@@ -405,5 +590,6 @@ class WorkItemsClient:
         Returns:
             The work item data
         """
-        response = self.client.get(f"issues/{issue_id}/timeTracking/workItems/{work_item_id}")
+        issue_id = sys.intern(issue_id)
+        response = self.client.get(_PATH_ITEM.format(issue_id, work_item_id))
         return response
\ No newline at end of file
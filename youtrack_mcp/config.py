@@ -31,6 +31,10 @@ class Config:
     # API client configuration
     MAX_RETRIES: int = int(os.getenv("YOUTRACK_MAX_RETRIES", "3"))
     RETRY_DELAY: float = float(os.getenv("YOUTRACK_RETRY_DELAY", "1.0"))
+    CONNECT_TIMEOUT: float = float(os.getenv("YOUTRACK_CONNECT_TIMEOUT", "3.05"))
+    READ_TIMEOUT: float = float(os.getenv("YOUTRACK_READ_TIMEOUT", "30"))
+    MAX_CONCURRENT_REQUESTS: int = int(os.getenv("YOUTRACK_MAX_CONCURRENT_REQUESTS", "8"))
+    MAX_RATE_LIMIT_WAIT: float = float(os.getenv("YOUTRACK_MAX_RATE_LIMIT_WAIT", "60"))
     
     # MCP Server configuration
     MCP_SERVER_NAME: str = os.getenv("MCP_SERVER_NAME", "youtrack-mcp")
@@ -38,7 +42,7 @@ class Config:
     MCP_DEBUG: bool = os.getenv("MCP_DEBUG", "false").lower() in ("true", "1", "yes")
     
     # Reference to allowed parent tickets from allowed_tickets.py
-    ALLOWED_PARENT_TICKETS: list = ALLOWED_PARENT_TICKETS
+    ALLOWED_PARENT_TICKETS: Optional[tuple] = ALLOWED_PARENT_TICKETS
     
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> None:
@@ -1,22 +1,187 @@
 """
 FastMCP 2.0 implementation for YouTrack MCP Server.
 """
+import asyncio
+import functools
+import inspect
 import json
 import logging
+import threading
+import time
 from typing import Dict, List, Any, Optional
 
 from fastmcp import FastMCP
+from pydantic import BaseModel
 
 from youtrack_mcp.config import config
-from youtrack_mcp.api.client import YouTrackClient
+from youtrack_mcp.api.client import YouTrackAPIError, YouTrackClient
 from youtrack_mcp.api.issues import IssuesClient
 from youtrack_mcp.api.projects import ProjectsClient
 from youtrack_mcp.api.users import UsersClient
 from youtrack_mcp.api.work_items import WorkItemsClient
 from youtrack_mcp.api.search import SearchClient
 
+# Optional import for orjson, used to serialize tool results
+try:
+    import orjson
+    # Option words for debug and normal output
+    _OPTS_PRETTY = orjson.OPT_INDENT_2
+    _OPTS_COMPACT = 0
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _default(obj: Any) -> Any:
+    """Convert values the JSON encoder cannot handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump(obj: Any) -> str:
+    """
+    Serialize a tool result to a JSON string.
+    
+    Args:
+        obj: Tool result, which may contain pydantic models
+        
+    Returns:
+        JSON document, indented only in debug mode
+    """
+    # Results are read by MCP clients, so whitespace only helps when debugging
+    if orjson is not None:
+        return orjson.dumps(obj, _default, _OPTS_PRETTY if config.MCP_DEBUG else _OPTS_COMPACT).decode()
+    if config.MCP_DEBUG:
+        return json.dumps(obj, indent=2, default=_default)
+    return json.dumps(obj, separators=(",", ":"), default=_default)
+
+
+def _compact_value(value: Any) -> Any:
+    """Reduce a custom field value to its display name, dropping type descriptors."""
+    if isinstance(value, list):
+        return [_compact_value(item) for item in value]
+    if isinstance(value, dict):
+        if "name" in value:
+            return value["name"]
+        if "presentation" in value:
+            return value["presentation"]
+        if "login" in value:
+            return value["login"]
+        if "text" in value:
+            return value["text"]
+        return {k: v for k, v in value.items() if k != "$type"}
+    return value
+
+
+def _compact_issue(issue: Any) -> Any:
+    """
+    Replace an issue's custom field list with a name to value mapping.
+    
+    Type descriptors and unset fields are dropped.
+    
+    Args:
+        issue: Issue data as returned by the API
+        
+    Returns:
+        The issue with compacted custom fields
+    """
+    if not isinstance(issue, dict):
+        return issue
+    
+    issue.pop("$type", None)
+    custom_fields = issue.get("customFields")
+    if isinstance(custom_fields, list):
+        issue["customFields"] = {
+            field["name"]: _compact_value(field["value"])
+            for field in custom_fields
+            if "name" in field and field.get("value") is not None
+        }
+    return issue
+
+
+# Issue fields returned by get_issue. Custom field values only carry the
+# attributes requested here, so these are the ones _compact_value reads.
+ISSUE_FIELDS = "id,summary,description,created,updated,project(id,name,shortName),reporter(id,login,name),assignee(id,login,name),customFields(name,value(name,presentation,login,text))"
+
+# Seconds a read-only lookup (projects, users) is reused before refetching
+_CACHE_TTL = 60.0
+_CACHE_MAXSIZE = 256
+
+# Cached lookup results, keyed by (qualified function name, args)
+_cache: Dict[tuple, tuple] = {}
+_cache_lock = threading.Lock()
+
+
+def _cached_call(func, *args) -> Any:
+    """
+    Call a read-only API function, reusing a result from the last _CACHE_TTL seconds.
+    
+    Args:
+        func: Bound API method to call
+        *args: Positional arguments for func, used as part of the cache key
+        
+    Returns:
+        The (possibly cached) result of func(*args)
+    """
+    key = (func.__qualname__, args)
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry is not None and now - entry[0] < _CACHE_TTL:
+        return entry[1]
+    
+    result = func(*args)
+    with _cache_lock:
+        if len(_cache) >= _CACHE_MAXSIZE:
+            # Evict the oldest entry
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = (now, result)
+    return result
+
+
+def _invalidate_cache(prefix: str) -> None:
+    """Drop cached results of functions whose qualified name starts with prefix."""
+    with _cache_lock:
+        for key in [key for key in _cache if key[0].startswith(prefix)]:
+            del _cache[key]
+
+
+def tool_handler(error_message: str):
+    """
+    Serialize a tool's result and report its failures as JSON errors.
+    
+    Args:
+        error_message: Log message for failures, formatted with the tool's arguments
+        
+    Returns:
+        Decorator for an async tool function
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        def describe(args, kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return error_message.format(**bound.arguments)
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> str:
+            try:
+                return _dump(await func(*args, **kwargs))
+            except (ValueError, YouTrackAPIError) as e:
+                # Expected failures (bad input, API errors) don't need a traceback
+                logger.warning(f"{describe(args, kwargs)}: {str(e)}")
+                return _dump({"error": str(e)})
+            except Exception as e:
+                logger.exception(describe(args, kwargs))
+                return _dump({"error": str(e)})
+        
+        return wrapper
+    return decorator
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     name=config.MCP_SERVER_NAME,
@@ -32,9 +197,16 @@ work_items_api = WorkItemsClient(client)
 search_api = SearchClient(client)
 
 
+@functools.lru_cache(maxsize=1)
+def _current_user() -> Any:
+    """Fetch the authenticated user once; the API token is fixed for the process."""
+    return users_api.get_current_user()
+
+
 # Issue Tools
 @mcp.tool()
-def get_issue(issue_id: str) -> str:
+@tool_handler("Error getting issue {issue_id}")
+async def get_issue(issue_id: str) -> Any:
     """
     Get information about a specific issue.
     
@@ -44,22 +216,42 @@ def get_issue(issue_id: str) -> str:
     Returns:
         JSON string with issue information
     """
-    try:
-        fields = "id,summary,description,created,updated,project(id,name,shortName),reporter(id,login,name),assignee(id,login,name),customFields(id,name,value)"
-        raw_issue = client.get(f"issues/{issue_id}?fields={fields}")
-        
-        if isinstance(raw_issue, dict) and raw_issue.get('$type') == 'Issue' and 'summary' not in raw_issue:
-            raw_issue['summary'] = f"Issue {issue_id}"
-        
-        return json.dumps(raw_issue, indent=2)
+    raw_issue = await asyncio.to_thread(client.get, f"issues/{issue_id}", params={"fields": ISSUE_FIELDS})
+    
+    if isinstance(raw_issue, dict) and raw_issue.get('$type') == 'Issue' and 'summary' not in raw_issue:
+        raw_issue['summary'] = f"Issue {issue_id}"
+    
+    return _compact_issue(raw_issue)
+
+
+@mcp.tool()
+@tool_handler("Error getting issues {issue_ids}")
+async def get_issues(issue_ids: List[str]) -> Any:
+    """
+    Get information about several issues in a single request.
+    
+    Args:
+        issue_ids: The issue IDs or readable IDs (e.g., ["PROJECT-123", "PROJECT-124"])
         
-    except Exception as e:
-        logger.exception(f"Error getting issue {issue_id}")
-        return json.dumps({"error": str(e)})
+    Returns:
+        JSON string with the issues that were found
+    """
+    # An empty query would match every issue
+    if not issue_ids:
+        return []
+    
+    params = {
+        "query": "issue id: " + ", ".join(issue_ids),
+        "$top": len(issue_ids),
+        "fields": ISSUE_FIELDS,
+    }
+    results = await asyncio.to_thread(client.get, "issues", params=params)
+    return [_compact_issue(issue) for issue in results]
 
 
 @mcp.tool()
-def search_issues(query: str, limit: int = 10) -> str:
+@tool_handler("Error searching issues with query: {query}")
+async def search_issues(query: str, limit: int = 10) -> Any:
     """
     Search for issues using YouTrack query language.
     
@@ -70,16 +262,13 @@ def search_issues(query: str, limit: int = 10) -> str:
     Returns:
         JSON string with search results
     """
-    try:
-        results = issues_api.search_issues(query, limit)
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.exception(f"Error searching issues with query: {query}")
-        return json.dumps({"error": str(e)})
+    results = await asyncio.to_thread(issues_api.search_issues, query, limit)
+    return results
 
 
 @mcp.tool()
-def create_issue(project_id: str, summary: str, description: str = "") -> str:
+@tool_handler("Error creating issue in project {project_id}")
+async def create_issue(project_id: str, summary: str, description: str = "") -> Any:
     """
     Create a new issue in a project.
     
@@ -91,16 +280,13 @@ def create_issue(project_id: str, summary: str, description: str = "") -> str:
     Returns:
         JSON string with created issue information
     """
-    try:
-        result = issues_api.create_issue(project_id, summary, description)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception(f"Error creating issue in project {project_id}")
-        return json.dumps({"error": str(e)})
+    result = await asyncio.to_thread(issues_api.create_issue, project_id, summary, description)
+    return result
 
 
 @mcp.tool()
-def add_comment(issue_id: str, text: str) -> str:
+@tool_handler("Error adding comment to issue {issue_id}")
+async def add_comment(issue_id: str, text: str) -> Any:
     """
     Add a comment to an issue.
     
@@ -111,17 +297,14 @@ def add_comment(issue_id: str, text: str) -> str:
     Returns:
         JSON string with comment information
     """
-    try:
-        result = issues_api.add_comment(issue_id, text)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception(f"Error adding comment to issue {issue_id}")
-        return json.dumps({"error": str(e)})
+    result = await asyncio.to_thread(issues_api.add_comment, issue_id, text)
+    return result
 
 
 # Project Tools
 @mcp.tool()
-def get_projects(include_archived: bool = False) -> str:
+@tool_handler("Error getting projects")
+async def get_projects(include_archived: bool = False) -> Any:
     """
     Get list of all projects.
     
@@ -131,16 +314,13 @@ def get_projects(include_archived: bool = False) -> str:
     Returns:
         JSON string with projects list
     """
-    try:
-        results = projects_api.get_projects(include_archived)
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.exception("Error getting projects")
-        return json.dumps({"error": str(e)})
+    results = await asyncio.to_thread(_cached_call, projects_api.get_projects, include_archived)
+    return results
 
 
 @mcp.tool()
-def get_project(project_id: str) -> str:
+@tool_handler("Error getting project {project_id}")
+async def get_project(project_id: str) -> Any:
     """
     Get details of a specific project.
     
@@ -150,16 +330,13 @@ def get_project(project_id: str) -> str:
     Returns:
         JSON string with project information
     """
-    try:
-        result = projects_api.get_project(project_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception(f"Error getting project {project_id}")
-        return json.dumps({"error": str(e)})
+    result = await asyncio.to_thread(_cached_call, projects_api.get_project, project_id)
+    return result
 
 
 @mcp.tool()
-def get_project_issues(project_id: str, limit: int = 20) -> str:
+@tool_handler("Error getting issues for project {project_id}")
+async def get_project_issues(project_id: str, limit: int = 20) -> Any:
     """
     Get issues for a specific project.
     
@@ -170,16 +347,34 @@ def get_project_issues(project_id: str, limit: int = 20) -> str:
     Returns:
         JSON string with project issues
     """
-    try:
-        results = projects_api.get_project_issues(project_id, limit)
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.exception(f"Error getting issues for project {project_id}")
-        return json.dumps({"error": str(e)})
+    results = await asyncio.to_thread(projects_api.get_project_issues, project_id, limit)
+    return results
 
 
 @mcp.tool()
-def create_project(name: str, short_name: str, description: str = "") -> str:
+@tool_handler("Error getting project {project_id} with issues")
+async def get_project_with_issues(project_id: str, limit: int = 20) -> Any:
+    """
+    Get details of a project together with its issues.
+    
+    Args:
+        project_id: The project ID or short name
+        limit: Maximum number of issues to return (default: 20)
+        
+    Returns:
+        JSON string with project information and project issues
+    """
+    # The two lookups are independent, so run them concurrently
+    project, issues = await asyncio.gather(
+        asyncio.to_thread(_cached_call, projects_api.get_project, project_id),
+        asyncio.to_thread(projects_api.get_project_issues, project_id, limit),
+    )
+    return {"project": project, "issues": issues}
+
+
+@mcp.tool()
+@tool_handler("Error creating project {short_name}")
+async def create_project(name: str, short_name: str, description: str = "") -> Any:
     """
     Create a new project.
     
@@ -191,33 +386,29 @@ def create_project(name: str, short_name: str, description: str = "") -> str:
     Returns:
         JSON string with created project information
     """
-    try:
-        result = projects_api.create_project(name, short_name, description)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception(f"Error creating project {short_name}")
-        return json.dumps({"error": str(e)})
+    result = await asyncio.to_thread(projects_api.create_project, name, short_name, description)
+    # The project list changed, so cached project lookups are stale
+    _invalidate_cache("ProjectsClient.")
+    return result
 
 
 # User Tools
 @mcp.tool()
-def get_current_user() -> str:
+@tool_handler("Error getting current user")
+async def get_current_user() -> Any:
     """
     Get information about the current authenticated user.
     
     Returns:
         JSON string with user information
     """
-    try:
-        result = users_api.get_current_user()
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception("Error getting current user")
-        return json.dumps({"error": str(e)})
+    result = await asyncio.to_thread(_current_user)
+    return result
 
 
 @mcp.tool()
-def get_user(user_id: str) -> str:
+@tool_handler("Error getting user {user_id}")
+async def get_user(user_id: str) -> Any:
     """
     Get information about a specific user.
     
@@ -227,16 +418,13 @@ def get_user(user_id: str) -> str:
     Returns:
         JSON string with user information
     """
-    try:
-        result = users_api.get_user(user_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception(f"Error getting user {user_id}")
-        return json.dumps({"error": str(e)})
+    result = await asyncio.to_thread(_cached_call, users_api.get_user, user_id)
+    return result
 
 
 @mcp.tool()
-def search_users(query: str, limit: int = 10) -> str:
+@tool_handler("Error searching users with query: {query}")
+async def search_users(query: str, limit: int = 10) -> Any:
     """
     Search for users.
     
@@ -247,17 +435,14 @@ def search_users(query: str, limit: int = 10) -> str:
     Returns:
         JSON string with search results
     """
-    try:
-        results = users_api.search_users(query, limit)
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.exception(f"Error searching users with query: {query}")
-        return json.dumps({"error": str(e)})
+    results = await asyncio.to_thread(users_api.search_users, query, limit)
+    return results
 
 
 # Work Items Tools
 @mcp.tool()
-def check_time_tracking(issue_id: str) -> str:
+@tool_handler("Error checking time tracking for issue {issue_id}")
+async def check_time_tracking(issue_id: str) -> Any:
     """
     Check if time tracking is enabled for a specific issue's project.
     
@@ -267,21 +452,18 @@ def check_time_tracking(issue_id: str) -> str:
     Returns:
         JSON string with time tracking availability information
     """
-    try:
-        is_enabled, message = work_items_api.is_time_tracking_enabled(issue_id)
-        result = {
-            "issue_id": issue_id,
-            "time_tracking_enabled": is_enabled,
-            "message": message
-        }
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception(f"Error checking time tracking for issue {issue_id}")
-        return json.dumps({"error": str(e)})
+    is_enabled, message = await asyncio.to_thread(work_items_api.is_time_tracking_enabled, issue_id)
+    result = {
+        "issue_id": issue_id,
+        "time_tracking_enabled": is_enabled,
+        "message": message
+    }
+    return result
 
 
 @mcp.tool()
-def get_work_items(issue_id: str) -> str:
+@tool_handler("Error getting work items for issue {issue_id}")
+async def get_work_items(issue_id: str) -> Any:
     """
     Get work items (time tracking entries) for a specific issue.
     
@@ -291,17 +473,14 @@ def get_work_items(issue_id: str) -> str:
     Returns:
         JSON string with work items
     """
-    try:
-        results = work_items_api.get_work_items(issue_id)
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.exception(f"Error getting work items for issue {issue_id}")
-        return json.dumps({"error": str(e)})
+    results = await asyncio.to_thread(work_items_api.get_work_items, issue_id)
+    return results
 
 
 
 @mcp.tool()
-def create_work_item(issue_id: str, duration: str, text: str = "") -> str:
+@tool_handler("Error creating work item for issue {issue_id}")
+async def create_work_item(issue_id: str, duration: str, text: str = "") -> Any:
     """
     Create a new work item for an issue (record time spent).
     
@@ -313,17 +492,14 @@ def create_work_item(issue_id: str, duration: str, text: str = "") -> str:
     Returns:
         JSON string with created work item information
     """
-    try:
-        result = work_items_api.create_work_item(issue_id, duration, text)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception(f"Error creating work item for issue {issue_id}")
-        return json.dumps({"error": str(e)})
+    result = await asyncio.to_thread(work_items_api.create_work_item, issue_id, duration, text)
+    return result
 
 
 
 @mcp.tool()
-def update_work_item(issue_id: str, work_item_id: str, duration: str = None, text: str = None) -> str:
+@tool_handler("Error updating work item {work_item_id} for issue {issue_id}")
+async def update_work_item(issue_id: str, work_item_id: str, duration: str = None, text: str = None) -> Any:
     """
     Update an existing work item.
     
@@ -336,16 +512,13 @@ def update_work_item(issue_id: str, work_item_id: str, duration: str = None, tex
     Returns:
         JSON string with updated work item information
     """
-    try:
-        result = work_items_api.update_work_item(issue_id, work_item_id, duration, text)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception(f"Error updating work item {work_item_id} for issue {issue_id}")
-        return json.dumps({"error": str(e)})
+    result = await asyncio.to_thread(work_items_api.update_work_item, issue_id, work_item_id, duration, text)
+    return result
 
 
 @mcp.tool()
-def delete_work_item(issue_id: str, work_item_id: str) -> str:
+@tool_handler("Error deleting work item {work_item_id} for issue {issue_id}")
+async def delete_work_item(issue_id: str, work_item_id: str) -> Any:
     """
     Delete a work item.
     
@@ -356,17 +529,14 @@ def delete_work_item(issue_id: str, work_item_id: str) -> str:
     Returns:
         JSON string with deletion confirmation
     """
-    try:
-        result = work_items_api.delete_work_item(issue_id, work_item_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.exception(f"Error deleting work item {work_item_id} for issue {issue_id}")
-        return json.dumps({"error": str(e)})
+    result = await asyncio.to_thread(work_items_api.delete_work_item, issue_id, work_item_id)
+    return result
 
 
 # Search Tools
 @mcp.tool()
-def advanced_search(query: str, sort_by: str = "created", sort_order: str = "desc", limit: int = 20) -> str:
+@tool_handler("Error in advanced search with query: {query}")
+async def advanced_search(query: str, sort_by: str = "created", sort_order: str = "desc", limit: int = 20) -> Any:
     """
     Advanced search with sorting options.
     
@@ -379,16 +549,13 @@ def advanced_search(query: str, sort_by: str = "created", sort_order: str = "des
     Returns:
         JSON string with search results
     """
-    try:
-        results = search_api.advanced_search(query, sort_by, sort_order, limit)
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.exception(f"Error in advanced search with query: {query}")
-        return json.dumps({"error": str(e)})
+    results = await asyncio.to_thread(search_api.advanced_search, query, sort_by, sort_order, limit)
+    return results
 
 
 @mcp.tool()
-def filter_issues(project: str = None, assignee: str = None, state: str = None, priority: str = None, limit: int = 20) -> str:
+@tool_handler("Error in filter_issues")
+async def filter_issues(project: str = None, assignee: str = None, state: str = None, priority: str = None, limit: int = 20) -> Any:
     """
     Search with structured filtering.
     
@@ -402,16 +569,13 @@ def filter_issues(project: str = None, assignee: str = None, state: str = None,
     Returns:
         JSON string with filtered results
     """
-    try:
-        results = search_api.filter_issues(project, assignee, state, priority, limit)
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.exception("Error in filter_issues")
-        return json.dumps({"error": str(e)})
+    results = await asyncio.to_thread(search_api.filter_issues, project, assignee, state, priority, limit)
+    return results
 
 
 @mcp.tool()
-def search_with_custom_fields(custom_fields: Dict[str, str], limit: int = 20) -> str:
+@tool_handler("Error in search_with_custom_fields")
+async def search_with_custom_fields(custom_fields: Dict[str, str], limit: int = 20) -> Any:
     """
     Search using custom field values.
     
@@ -422,12 +586,8 @@ def search_with_custom_fields(custom_fields: Dict[str, str], limit: int = 20) ->
     Returns:
         JSON string with search results
     """
-    try:
-        results = search_api.search_with_custom_fields(custom_fields, limit)
-        return json.dumps(results, indent=2)
-    except Exception as e:
-        logger.exception("Error in search_with_custom_fields")
-        return json.dumps({"error": str(e)})
+    results = await asyncio.to_thread(search_api.search_with_custom_fields, custom_fields, limit)
+    return results
 
 
 def get_server():